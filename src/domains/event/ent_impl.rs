@@ -11,9 +11,8 @@ use crate::infrastructure::tao_core::tao::Tao;
 use thrift::protocol::{TCompactInputProtocol, TSerializable};
 use crate::infrastructure::global_tao::get_global_tao;
 use std::io::Cursor;
-use regex;
-use crate::domains::user::EntUser;
 use crate::domains::post::EntPost;
+use crate::domains::user::EntUser;
 
 impl Entity for EntEvent {
     const ENTITY_TYPE: &'static str = "ent_event";
@@ -1,9 +1,9 @@
 // Generated domain modules
 // DO NOT EDIT
 
+pub mod comment;
+pub mod event;
+pub mod group;
 pub mod page;
 pub mod post;
 pub mod user;
-pub mod comment;
-pub mod group;
-pub mod event;
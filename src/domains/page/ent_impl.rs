@@ -11,7 +11,6 @@ use crate::infrastructure::tao_core::tao::Tao;
 use thrift::protocol::{TCompactInputProtocol, TSerializable};
 use crate::infrastructure::global_tao::get_global_tao;
 use std::io::Cursor;
-use regex;
 use crate::domains::post::EntPost;
 use crate::domains::user::EntUser;
 
@@ -11,12 +11,11 @@ use crate::infrastructure::tao_core::tao::Tao;
 use thrift::protocol::{TCompactInputProtocol, TSerializable};
 use crate::infrastructure::global_tao::get_global_tao;
 use std::io::Cursor;
-use regex;
-use crate::domains::event::EntEvent;
 use crate::domains::comment::EntComment;
-use crate::domains::user::EntUser;
-use crate::domains::page::EntPage;
+use crate::domains::event::EntEvent;
 use crate::domains::group::EntGroup;
+use crate::domains::page::EntPage;
+use crate::domains::user::EntUser;
 
 impl Entity for EntPost {
     const ENTITY_TYPE: &'static str = "ent_post";
@@ -130,8 +130,8 @@ impl HasTao for EntUserBuilderState {
 
 impl EntUser {
     /// Create a new entity builder state (Meta's pattern: EntUser::create(vc))
-    pub fn create<V>(vc: V) -> EntUserBuilderState 
-    where 
+    pub fn create<V>(vc: V) -> EntUserBuilderState
+    where
         V: Into<Arc<ViewerContext>>,
     {
         let vc = vc.into();
@@ -12,10 +12,15 @@ use thrift::protocol::{TCompactInputProtocol, TSerializable};
 use crate::infrastructure::global_tao::get_global_tao;
 use std::io::Cursor;
 use regex;
-use crate::domains::post::EntPost;
+use crate::domains::event::EntEvent;
 use crate::domains::group::EntGroup;
 use crate::domains::page::EntPage;
-use crate::domains::event::EntEvent;
+use crate::domains::post::EntPost;
+
+static USERNAME_REGEX: once_cell::sync::Lazy<regex::Regex> =
+    once_cell::sync::Lazy::new(|| regex::Regex::new(r"^[a-zA-Z0-9_]+$").unwrap());
+static EMAIL_REGEX: once_cell::sync::Lazy<regex::Regex> =
+    once_cell::sync::Lazy::new(|| regex::Regex::new(r"^[^\s@]+@[^\s@]+\.[^\s@]+$").unwrap());
 
 impl Entity for EntUser {
     const ENTITY_TYPE: &'static str = "ent_user";
@@ -40,8 +45,7 @@ impl Entity for EntUser {
             errors.push("username cannot exceed 30 characters".to_string());
         }
         // Validate username pattern
-        let username_regex = regex::Regex::new(r"^[a-zA-Z0-9_]+$").unwrap();
-        if !username_regex.is_match(&self.username) {
+        if !USERNAME_REGEX.is_match(&self.username) {
             errors.push("username format is invalid".to_string());
         }
         
@@ -50,8 +54,7 @@ impl Entity for EntUser {
             errors.push("email cannot be empty".to_string());
         }
         // Validate email pattern
-        let email_regex = regex::Regex::new(r"^[^\s@]+@[^\s@]+\.[^\s@]+$").unwrap();
-        if !email_regex.is_match(&self.email) {
+        if !EMAIL_REGEX.is_match(&self.email) {
             errors.push("email format is invalid".to_string());
         }
         
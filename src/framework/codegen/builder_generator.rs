@@ -13,23 +13,25 @@ impl<'a> BuilderGenerator<'a> {
         }
     }
 
-    /// Generate builder state struct and EntBuilder implementation for entity
+    /// Generate builder state struct and EntBuilder implementation for entity,
+    /// returned as a (path, content) pair for the caller to batch-write
     pub fn generate_builder(
         &self,
         entity_type: &EntityType,
         fields: &[FieldDefinition],
-    ) -> Result<(), String> {
+    ) -> Result<(String, String), String> {
         let domain_name = utils::entity_domain_name(entity_type);
         let struct_name = utils::entity_struct_name(entity_type);
         let state_name = format!("{}BuilderState", struct_name);
         let builder_path = format!("src/domains/{}/builder.rs", domain_name);
 
-        let mut builder_content = String::new();
+        // Generated builders run 4-8KB; size the buffer once up front
+        let mut builder_content = String::with_capacity(8 * 1024);
 
         // Generate file header
         builder_content.push_str(&utils::generate_file_header(
             "Unified Builder pattern implementation",
-            entity_type,
+            &struct_name,
         ));
 
         // Generate imports
@@ -60,11 +62,7 @@ impl<'a> BuilderGenerator<'a> {
         // Generate entity create() method
         builder_content.push_str(&self.generate_entity_create_method(&struct_name, &state_name)?);
 
-        // Write to file
-        std::fs::write(&builder_path, builder_content)
-            .map_err(|e| format!("Failed to write builder file {}: {}", builder_path, e))?;
-
-        Ok(())
+        Ok((builder_path, builder_content))
     }
 
     /// Generate necessary imports for builder
@@ -153,18 +151,16 @@ use std::sync::Arc;
         _entity_type: &EntityType,
         struct_name: &str,
     ) -> Result<String, String> {
-        let mut savex_method = "    /// Save the entity to database via TAO\n".to_string();
-        savex_method.push_str(&format!(
-            "    pub async fn savex(self) -> AppResult<{}> {{\n",
-            struct_name
-        ));
-        savex_method.push_str("        let tao = self.get_tao().ok_or_else(|| AppError::Internal(\"Tao instance not provided to builder\".to_string()))?;\n");
-        savex_method.push_str(&format!(
-            "        tao.create_entity::<{}>(self).await\n",
-            struct_name
-        ));
-        savex_method.push_str("    }\n\n");
-        Ok(savex_method)
+        // Single template, parsed once at compile time
+        Ok(format!(
+            r#"    /// Save the entity to database via TAO
+    pub async fn savex(self) -> AppResult<{struct_name}> {{
+        let tao = self.get_tao().ok_or_else(|| AppError::Internal("Tao instance not provided to builder".to_string()))?;
+        tao.create_entity::<{struct_name}>(self).await
+    }}
+
+"#
+        ))
     }
 
     /// Generate EntBuilder implementation on entity type
@@ -245,35 +241,41 @@ use std::sync::Arc;
         struct_name: &str,
         state_name: &str,
     ) -> Result<String, String> {
-        let mut create_method = format!("impl {} {{\n", struct_name);
-
-        create_method.push_str("    /// Create a new entity builder state (Meta's pattern: EntUser::create(vc))\n");
-        create_method.push_str(&format!("    pub fn create<V>(vc: V) -> {} \n", state_name));
-        create_method.push_str("    where \n");
-        create_method.push_str("        V: Into<Arc<ViewerContext>>,\n");
-        create_method.push_str("    {\n");
-        create_method.push_str(&format!("        let vc = vc.into();\n"));
-        create_method.push_str(&format!("        let mut builder = {}::default();\n", state_name));
-        create_method.push_str("        // Extract TAO from viewer context following Meta's pattern\n");
-        create_method.push_str("        builder.set_tao(Arc::clone(&vc.tao));\n");
-        create_method.push_str("        builder\n");
-        create_method.push_str("    }\n");
-
-        create_method.push_str("}\n\n");
-
-        Ok(create_method)
+        // Single template, parsed once at compile time
+        Ok(format!(
+            r#"impl {struct_name} {{
+    /// Create a new entity builder state (Meta's pattern: EntUser::create(vc))
+    pub fn create<V>(vc: V) -> {state_name}
+    where
+        V: Into<Arc<ViewerContext>>,
+    {{
+        let vc = vc.into();
+        let mut builder = {state_name}::default();
+        // Extract TAO from viewer context following Meta's pattern
+        builder.set_tao(Arc::clone(&vc.tao));
+        builder
+    }}
+}}
+
+"#
+        ))
     }
 
     /// Generate HasTao implementation for builder state
     fn generate_has_tao_impl(&self, state_name: &str) -> Result<String, String> {
-        let mut impl_block = format!("impl HasTao for {} {{\n", state_name);
-        impl_block.push_str("    fn get_tao(&self) -> Option<Arc<dyn TaoOperations>> {\n");
-        impl_block.push_str("        self.tao.clone()\n");
-        impl_block.push_str("    }\n\n");
-        impl_block.push_str("    fn set_tao(&mut self, tao: Arc<dyn TaoOperations>) {\n");
-        impl_block.push_str("        self.tao = Some(tao);\n");
-        impl_block.push_str("    }\n");
-        impl_block.push_str("}\n\n");
-        Ok(impl_block)
+        // Single template, parsed once at compile time
+        Ok(format!(
+            r#"impl HasTao for {state_name} {{
+    fn get_tao(&self) -> Option<Arc<dyn TaoOperations>> {{
+        self.tao.clone()
+    }}
+
+    fn set_tao(&mut self, tao: Arc<dyn TaoOperations>) {{
+        self.tao = Some(tao);
+    }}
+}}
+
+"#
+        ))
     }
 }
@@ -1,9 +1,25 @@
 // Ent trait implementation generator
+use std::fmt::Write;
+
 use super::utils;
 use crate::framework::schema::ent_schema::{
     EdgeDefinition, EntityType, FieldDefinition, SchemaRegistry,
 };
 
+/// Edge target lookup table: (struct name, import line) per entity type.
+/// Both import generation and edge method generation read from this single
+/// table, so adding an entity type needs no control-flow edits.
+fn edge_target(entity_type: &EntityType) -> (&'static str, &'static str) {
+    match entity_type {
+        EntityType::EntUser => ("EntUser", "use crate::domains::user::EntUser;"),
+        EntityType::EntPost => ("EntPost", "use crate::domains::post::EntPost;"),
+        EntityType::EntGroup => ("EntGroup", "use crate::domains::group::EntGroup;"),
+        EntityType::EntPage => ("EntPage", "use crate::domains::page::EntPage;"),
+        EntityType::EntEvent => ("EntEvent", "use crate::domains::event::EntEvent;"),
+        EntityType::EntComment => ("EntComment", "use crate::domains::comment::EntComment;"),
+    }
+}
+
 pub struct EntGenerator<'a> {
     _registry: &'a SchemaRegistry,
 }
@@ -15,33 +31,38 @@ impl<'a> EntGenerator<'a> {
         }
     }
 
-    /// Generate Ent trait implementation
+    /// Generate Ent trait implementation, returned as a (path, content)
+    /// pair for the caller to batch-write
     pub fn generate_ent_impl(
         &self,
         entity_type: &EntityType,
         fields: &[FieldDefinition],
         edges: &[EdgeDefinition],
-    ) -> Result<(), String> {
+    ) -> Result<(String, String), String> {
         let domain_name = utils::entity_domain_name(entity_type);
         let struct_name = utils::entity_struct_name(entity_type);
         let ent_impl_path = format!("src/domains/{}/ent_impl.rs", domain_name);
 
-        let mut ent_content = String::new();
+        // Generated Ent implementations run 8-16KB; size the buffer once up front
+        let mut ent_content = String::with_capacity(16 * 1024);
 
         // Generate file header
         ent_content.push_str(&utils::generate_file_header(
             "Ent trait implementation",
-            entity_type,
+            &struct_name,
         ));
 
         // Generate imports
-        ent_content.push_str(&self.generate_imports(&struct_name, edges));
+        ent_content.push_str(&self.generate_imports(&struct_name, fields, edges));
+
+        // Generate pattern regex statics (compiled once, not per validate() call)
+        ent_content.push_str(&self.generate_pattern_statics(fields)?);
 
         // Generate Ent trait implementation (Entity trait methods)
         ent_content.push_str(&self.generate_ent_trait_impl(entity_type, &struct_name, fields)?);
 
         // Start a new impl block for associated functions
-        ent_content.push_str(&format!("impl {} {{\n", struct_name));
+        write!(ent_content, "impl {} {{\n", struct_name).unwrap();
 
         // Generate from_tao_object method (associated function)
         ent_content.push_str(&self.generate_from_tao_object_method_content(&struct_name)?);
@@ -52,19 +73,20 @@ impl<'a> EntGenerator<'a> {
         // Close the impl block
         ent_content.push_str("}\n\n");
 
-        // Write to file
-        std::fs::write(&ent_impl_path, ent_content)
-            .map_err(|e| format!("Failed to write ent_impl file {}: {}", ent_impl_path, e))?;
-
-        Ok(())
+        Ok((ent_impl_path, ent_content))
     }
 
     /// Generate necessary imports including cross-entity imports for edges
-    fn generate_imports(&self, struct_name: &str, edges: &[EdgeDefinition]) -> String {
+    fn generate_imports(
+        &self,
+        struct_name: &str,
+        fields: &[FieldDefinition],
+        edges: &[EdgeDefinition],
+    ) -> String {
         let mut imports = String::from("use std::sync::Arc;\n");
         imports.push_str("use crate::framework::entity::ent_trait::Entity;\n");
         imports.push_str("use crate::error::AppResult;\n");
-        imports.push_str(&format!("use super::entity::{};\n", struct_name));
+        write!(imports, "use super::entity::{};\n", struct_name).unwrap();
         imports.push_str(
             "use crate::infrastructure::tao_core::tao_core::{TaoOperations, TaoObject};\n",
         );
@@ -72,23 +94,30 @@ impl<'a> EntGenerator<'a> {
         imports.push_str("use thrift::protocol::{TCompactInputProtocol, TSerializable};\n");
         imports.push_str("use crate::infrastructure::global_tao::get_global_tao;\n");
         imports.push_str("use std::io::Cursor;\n");
-        imports.push_str("use regex;\n");
 
-        // Add cross-entity imports for edge traversal, excluding current entity to avoid duplicates
+        // Only pull in regex when the entity actually has pattern validators
+        let has_pattern = fields.iter().any(|field| {
+            field.validators.iter().any(|validator| {
+                matches!(
+                    validator,
+                    crate::framework::schema::ent_schema::FieldValidator::Pattern(_)
+                )
+            })
+        });
+        if has_pattern {
+            imports.push_str("use regex;\n");
+        }
+
+        // Add cross-entity imports for edge traversal, excluding current
+        // entity to avoid duplicates. The sorted set keeps the emitted order
+        // deterministic so unchanged files are skipped on flush
         let current_entity_type = self.entity_type_from_struct_name(struct_name);
-        let mut imported_entities = std::collections::HashSet::new();
+        let mut imported_entities = std::collections::BTreeSet::new();
 
         for edge in edges {
             // Skip importing the current entity type to avoid duplicate imports
             if edge.target_entity != current_entity_type {
-                let entity_import = match edge.target_entity {
-                    EntityType::EntUser => "use crate::domains::user::EntUser;",
-                    EntityType::EntPost => "use crate::domains::post::EntPost;",
-                    EntityType::EntGroup => "use crate::domains::group::EntGroup;",
-                    EntityType::EntPage => "use crate::domains::page::EntPage;",
-                    EntityType::EntEvent => "use crate::domains::event::EntEvent;",
-                    EntityType::EntComment => "use crate::domains::comment::EntComment;",
-                };
+                let (_, entity_import) = edge_target(&edge.target_entity);
                 imported_entities.insert(entity_import);
             }
         }
@@ -118,6 +147,39 @@ impl<'a> EntGenerator<'a> {
         }
     }
 
+    /// Generate module-level regex statics for pattern validators so each
+    /// pattern is compiled once (at first use) instead of on every validate() call
+    fn generate_pattern_statics(&self, fields: &[FieldDefinition]) -> Result<String, String> {
+        let mut statics = String::new();
+
+        for field in fields {
+            for validator in &field.validators {
+                if let crate::framework::schema::ent_schema::FieldValidator::Pattern(pattern) =
+                    validator
+                {
+                    write!(
+                        statics,
+                        "static {}_REGEX: once_cell::sync::Lazy<regex::Regex> =\n",
+                        field.name.to_uppercase()
+                    )
+                    .unwrap();
+                    write!(
+                        statics,
+                        "    once_cell::sync::Lazy::new(|| regex::Regex::new(r\"{}\").unwrap());\n",
+                        pattern
+                    )
+                    .unwrap();
+                }
+            }
+        }
+
+        if !statics.is_empty() {
+            statics.push('\n');
+        }
+
+        Ok(statics)
+    }
+
     /// Generate Entity trait implementation with comprehensive validations
     fn generate_ent_trait_impl(
         &self,
@@ -128,11 +190,13 @@ impl<'a> EntGenerator<'a> {
         let mut impl_block = String::new();
 
         // Generate Entity implementation with required methods
-        impl_block.push_str(&format!("impl Entity for {} {{\n", struct_name));
-        impl_block.push_str(&format!(
+        write!(impl_block, "impl Entity for {} {{\n", struct_name).unwrap();
+        write!(
+            impl_block,
             "    const ENTITY_TYPE: &'static str = \"{}\";\n",
             entity_type
-        ));
+        )
+        .unwrap();
         impl_block.push_str("    \n");
         impl_block.push_str("    fn id(&self) -> i64 {\n");
         impl_block.push_str("        self.id\n");
@@ -153,18 +217,24 @@ impl<'a> EntGenerator<'a> {
             if !field.optional {
                 match field.field_type {
                     crate::framework::schema::ent_schema::FieldType::String => {
-                        impl_block.push_str(&format!(
+                        write!(
+                            impl_block,
                             "        // Validate {} (required)\n",
                             field_display
-                        ));
-                        impl_block.push_str(&format!(
+                        )
+                        .unwrap();
+                        write!(
+                            impl_block,
                             "        if self.{}.trim().is_empty() {{\n",
                             field.name
-                        ));
-                        impl_block.push_str(&format!(
+                        )
+                        .unwrap();
+                        write!(
+                            impl_block,
                             "            errors.push(\"{} cannot be empty\".to_string());\n",
                             field_display
-                        ));
+                        )
+                        .unwrap();
                         impl_block.push_str("        }\n");
                     }
                     crate::framework::schema::ent_schema::FieldType::Bool => {
@@ -179,89 +249,111 @@ impl<'a> EntGenerator<'a> {
                 match validator {
                     crate::framework::schema::ent_schema::FieldValidator::MinLength(min) => {
                         if field.optional {
-                            impl_block.push_str(&format!(
+                            write!(
+                                impl_block,
                                 "        // Validate {} min length\n",
                                 field_display
-                            ));
-                            impl_block.push_str(&format!(
+                            )
+                            .unwrap();
+                            write!(
+                                impl_block,
                                 "        if let Some(ref val) = self.{} {{\n",
                                 field.name
-                            ));
-                            impl_block
-                                .push_str(&format!("            if val.len() < {} {{\n", min));
-                            impl_block.push_str(&format!("                errors.push(\"{} must be at least {} characters\".to_string());\n", field_display, min));
+                            )
+                            .unwrap();
+                            write!(impl_block, "            if val.len() < {} {{\n", min).unwrap();
+                            write!(impl_block, "                errors.push(\"{} must be at least {} characters\".to_string());\n", field_display, min).unwrap();
                             impl_block.push_str("            }\n");
                             impl_block.push_str("        }\n");
                         } else {
-                            impl_block.push_str(&format!(
+                            write!(
+                                impl_block,
                                 "        // Validate {} min length\n",
                                 field_display
-                            ));
-                            impl_block.push_str(&format!(
+                            )
+                            .unwrap();
+                            write!(
+                                impl_block,
                                 "        if self.{}.len() < {} {{\n",
                                 field.name, min
-                            ));
-                            impl_block.push_str(&format!("            errors.push(\"{} must be at least {} characters\".to_string());\n", field_display, min));
+                            )
+                            .unwrap();
+                            write!(impl_block, "            errors.push(\"{} must be at least {} characters\".to_string());\n", field_display, min).unwrap();
                             impl_block.push_str("        }\n");
                         }
                     }
                     crate::framework::schema::ent_schema::FieldValidator::MaxLength(max) => {
                         if field.optional {
-                            impl_block.push_str(&format!(
+                            write!(
+                                impl_block,
                                 "        // Validate {} max length\n",
                                 field_display
-                            ));
-                            impl_block.push_str(&format!(
+                            )
+                            .unwrap();
+                            write!(
+                                impl_block,
                                 "        if let Some(ref val) = self.{} {{\n",
                                 field.name
-                            ));
-                            impl_block
-                                .push_str(&format!("            if val.len() > {} {{\n", max));
-                            impl_block.push_str(&format!("                errors.push(\"{} cannot exceed {} characters\".to_string());\n", field_display, max));
+                            )
+                            .unwrap();
+                            write!(impl_block, "            if val.len() > {} {{\n", max).unwrap();
+                            write!(impl_block, "                errors.push(\"{} cannot exceed {} characters\".to_string());\n", field_display, max).unwrap();
                             impl_block.push_str("            }\n");
                             impl_block.push_str("        }\n");
                         } else {
-                            impl_block.push_str(&format!(
+                            write!(
+                                impl_block,
                                 "        // Validate {} max length\n",
                                 field_display
-                            ));
-                            impl_block.push_str(&format!(
+                            )
+                            .unwrap();
+                            write!(
+                                impl_block,
                                 "        if self.{}.len() > {} {{\n",
                                 field.name, max
-                            ));
-                            impl_block.push_str(&format!("            errors.push(\"{} cannot exceed {} characters\".to_string());\n", field_display, max));
+                            )
+                            .unwrap();
+                            write!(impl_block, "            errors.push(\"{} cannot exceed {} characters\".to_string());\n", field_display, max).unwrap();
                             impl_block.push_str("        }\n");
                         }
                     }
-                    crate::framework::schema::ent_schema::FieldValidator::Pattern(pattern) => {
-                        impl_block
-                            .push_str(&format!("        // Validate {} pattern\n", field_display));
-                        impl_block.push_str(&format!(
-                            "        let {}_regex = regex::Regex::new(r\"{}\").unwrap();\n",
-                            field.name,
-                            pattern.replace('\\', "\\")
-                        ));
+                    crate::framework::schema::ent_schema::FieldValidator::Pattern(_pattern) => {
+                        write!(
+                            impl_block,
+                            "        // Validate {} pattern\n",
+                            field_display
+                        )
+                        .unwrap();
                         if field.optional {
-                            impl_block.push_str(&format!(
+                            write!(
+                                impl_block,
                                 "        if let Some(ref val) = self.{} {{\n",
                                 field.name
-                            ));
-                            impl_block.push_str(&format!(
-                                "            if !{}_regex.is_match(val) {{\n",
-                                field.name
-                            ));
-                            impl_block.push_str(&format!("                errors.push(\"{} format is invalid\".to_string());\n", field_display));
+                            )
+                            .unwrap();
+                            write!(
+                                impl_block,
+                                "            if !{}_REGEX.is_match(val) {{\n",
+                                field.name.to_uppercase()
+                            )
+                            .unwrap();
+                            write!(impl_block, "                errors.push(\"{} format is invalid\".to_string());\n", field_display).unwrap();
                             impl_block.push_str("            }\n");
                             impl_block.push_str("        }\n");
                         } else {
-                            impl_block.push_str(&format!(
-                                "        if !{}_regex.is_match(&self.{}) {{\n",
-                                field.name, field.name
-                            ));
-                            impl_block.push_str(&format!(
+                            write!(
+                                impl_block,
+                                "        if !{}_REGEX.is_match(&self.{}) {{\n",
+                                field.name.to_uppercase(),
+                                field.name
+                            )
+                            .unwrap();
+                            write!(
+                                impl_block,
                                 "            errors.push(\"{} format is invalid\".to_string());\n",
                                 field_display
-                            ));
+                            )
+                            .unwrap();
                             impl_block.push_str("        }\n");
                         }
                     }
@@ -283,24 +375,28 @@ impl<'a> EntGenerator<'a> {
     fn generate_from_tao_object_method_content(&self, struct_name: &str) -> Result<String, String> {
         let mut method_block = String::new();
         method_block.push_str("    /// Create an entity from a TaoObject\n");
-        method_block.push_str(&format!(
+        write!(method_block,
             "    pub(crate) async fn from_tao_object(tao_obj: TaoObject) -> AppResult<Option<{}>> {{\n",
             struct_name
-        ));
-        method_block.push_str(&format!(
+        ).unwrap();
+        write!(
+            method_block,
             "        if tao_obj.otype != {}::ENTITY_TYPE {{\n",
             struct_name
-        ));
+        )
+        .unwrap();
         method_block.push_str("            return Ok(None);\n");
         method_block.push_str("        }\n");
         method_block.push_str("        \n");
         method_block.push_str("        let mut cursor = Cursor::new(&tao_obj.data);\n");
         method_block
             .push_str("        let mut protocol = TCompactInputProtocol::new(&mut cursor);\n");
-        method_block.push_str(&format!(
+        write!(
+            method_block,
             "        let mut entity = {}::read_from_in_protocol(&mut protocol)\n",
             struct_name
-        ));
+        )
+        .unwrap();
         method_block.push_str("            .map_err(|e| crate::error::AppError::SerializationError(e.to_string()))?;\n");
         method_block.push_str("        \n");
         method_block.push_str("        Ok(Some(entity))\n");
@@ -323,37 +419,34 @@ impl<'a> EntGenerator<'a> {
             edge_methods.push_str("    \n");
             for edge in edges {
                 let method_name = format!("get_{}", edge.name);
-                let return_type = match edge.target_entity {
-                    EntityType::EntUser => "EntUser",
-                    EntityType::EntPost => "EntPost",
-                    EntityType::EntGroup => "EntGroup",
-                    EntityType::EntPage => "EntPage",
-                    EntityType::EntEvent => "EntEvent",
-                    EntityType::EntComment => "EntComment",
-                };
+                let (return_type, _) = edge_target(&edge.target_entity);
 
                 let _edge_type = edge.name.to_uppercase();
 
                 // Generate get method with real TAO implementation
-                edge_methods.push_str(&format!(
+                write!(
+                    edge_methods,
                     "    /// Get {} via TAO edge traversal\n",
                     edge.name.replace('_', " ")
-                ));
-                edge_methods.push_str(&format!(
+                )
+                .unwrap();
+                write!(
+                    edge_methods,
                     "    pub async fn {}(&self) -> AppResult<Vec<{}>> {{\n", // Removed tao parameter
                     method_name, return_type
-                ));
+                )
+                .unwrap();
                 edge_methods.push_str("        let tao = get_global_tao()?.clone();\n"); // Get global tao instance
-                edge_methods.push_str(&format!("        let neighbor_ids = tao.get_neighbor_ids(self.id(), \"{}\".to_string(), Some(100)).await?;\n", edge.name));
+                write!(edge_methods, "        let neighbor_ids = tao.get_neighbor_ids(self.id(), \"{}\".to_string(), Some(100)).await?;\n", edge.name).unwrap();
                 edge_methods.push('\n');
                 edge_methods.push_str("        let mut results = Vec::new();\n");
                 edge_methods.push_str("        for id in neighbor_ids {\n");
                 edge_methods
                     .push_str("            if let Some(tao_obj) = tao.obj_get(id).await? {\n");
-                edge_methods.push_str(&format!(
+                write!(edge_methods,
                     "                if let Some(entity) = {}::from_tao_object(tao_obj).await? {{\n",
                     return_type
-                )); // Removed tao parameter
+                ).unwrap(); // Removed tao parameter
                 edge_methods.push_str("                    results.push(entity);\n");
                 edge_methods.push_str("                }\n");
                 edge_methods.push_str("            }\n");
@@ -365,19 +458,25 @@ impl<'a> EntGenerator<'a> {
 
                 // Generate count method with real TAO implementation
                 let count_method = format!("count_{}", edge.name);
-                edge_methods.push_str(&format!(
+                write!(
+                    edge_methods,
                     "    /// Count {} via TAO edge traversal\n",
                     edge.name.replace('_', " ")
-                ));
-                edge_methods.push_str(&format!(
+                )
+                .unwrap();
+                write!(
+                    edge_methods,
                     "    pub async fn {}(&self) -> AppResult<i64> {{\n", // Removed tao parameter
                     count_method
-                ));
+                )
+                .unwrap();
                 edge_methods.push_str("        let tao = get_global_tao()?.clone();\n"); // Get global tao instance
-                edge_methods.push_str(&format!(
+                write!(
+                    edge_methods,
                     "        let count = tao.assoc_count(self.id(), \"{}\".to_string()).await?;\n",
                     edge.name
-                ));
+                )
+                .unwrap();
                 edge_methods.push_str("        Ok(count as i64)\n");
                 edge_methods.push_str("    }\n");
                 edge_methods.push_str("    \n");
@@ -385,26 +484,32 @@ impl<'a> EntGenerator<'a> {
                 // Generate add edge method for bidirectional relationships
                 if edge.bidirectional {
                     let add_method = format!("add_{}", edge.name.trim_end_matches('s')); // Remove plural 's'
-                    edge_methods.push_str(&format!(
+                    write!(
+                        edge_methods,
                         "    /// Add {} association via TAO\n",
                         edge.name.trim_end_matches('s').replace('_', " ")
-                    ));
-                    edge_methods.push_str(&format!(
+                    )
+                    .unwrap();
+                    write!(
+                        edge_methods,
                         "    pub async fn {}(&self, target_id: i64) -> AppResult<()> {{\n",
                         add_method
-                    )); // Removed tao parameter
+                    )
+                    .unwrap(); // Removed tao parameter
                     edge_methods.push_str("        let tao = get_global_tao()?.clone();\n"); // Get global tao instance
-                    edge_methods.push_str(&format!("        // Fetch the {} to ensure it exists before creating an association\n", return_type));
-                    edge_methods.push_str(&format!(
+                    write!(edge_methods, "        // Fetch the {} to ensure it exists before creating an association\n", return_type).unwrap();
+                    write!(
+                        edge_methods,
                         "        let _{} = {}::from_tao_object(\n",
                         edge.name.trim_end_matches('s'),
                         return_type
-                    ));
+                    )
+                    .unwrap();
                     edge_methods.push_str("            tao.obj_get(target_id).await?\n");
-                    edge_methods.push_str(&format!("                .ok_or_else(|| crate::error::AppError::NotFound(format!(\"{} with id {{}} not found\", target_id)))?\n", return_type));
+                    write!(edge_methods, "                .ok_or_else(|| crate::error::AppError::NotFound(format!(\"{} with id {{}} not found\", target_id)))?\n", return_type).unwrap();
                     edge_methods.push_str("        ).await?;\n");
                     edge_methods.push('\n');
-                    edge_methods.push_str(&format!("        let assoc = crate::infrastructure::tao_core::tao_core::create_tao_association(self.id(), \"{}\".to_string(), target_id, None);\n", edge.name));
+                    write!(edge_methods, "        let assoc = crate::infrastructure::tao_core::tao_core::create_tao_association(self.id(), \"{}\".to_string(), target_id, None);\n", edge.name).unwrap();
                     edge_methods.push_str("        tao.assoc_add(assoc).await?;\n");
                     edge_methods.push_str("        Ok(())\n");
                     edge_methods.push_str("    }\n");
@@ -412,16 +517,20 @@ impl<'a> EntGenerator<'a> {
 
                     // Generate remove edge method
                     let remove_method = format!("remove_{}", edge.name.trim_end_matches('s'));
-                    edge_methods.push_str(&format!(
+                    write!(
+                        edge_methods,
                         "    /// Remove {} association via TAO\n",
                         edge.name.trim_end_matches('s').replace('_', " ")
-                    ));
-                    edge_methods.push_str(&format!(
+                    )
+                    .unwrap();
+                    write!(
+                        edge_methods,
                         "    pub async fn {}(&self, target_id: i64) -> AppResult<bool> {{\n",
                         remove_method
-                    )); // Removed tao parameter
+                    )
+                    .unwrap(); // Removed tao parameter
                     edge_methods.push_str("        let tao = get_global_tao()?.clone();\n"); // Get global tao instance
-                    edge_methods.push_str(&format!("        tao.assoc_delete(self.id(), \"{}\".to_string(), target_id).await\n", edge.name));
+                    write!(edge_methods, "        tao.assoc_delete(self.id(), \"{}\".to_string(), target_id).await\n", edge.name).unwrap();
                     edge_methods.push_str("    }\n");
                     edge_methods.push_str("    \n");
                 }
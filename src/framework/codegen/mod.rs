@@ -12,6 +12,10 @@ use crate::framework::schema::ent_schema::{
 };
 use std::collections::HashMap;
 
+/// Sidecar manifest listing every path the last codegen run produced, so
+/// cleanup can target exact files instead of re-walking the domain tree
+const GENERATED_MANIFEST: &str = "src/domains/.generated_manifest";
+
 /// Main code generator orchestrator
 pub struct CodeGenerator {
     registry: SchemaRegistry,
@@ -26,65 +30,124 @@ impl CodeGenerator {
     pub fn generate_all(&self) -> Result<(), String> {
         println!("🚀 Starting modular Ent codegen pipeline");
 
-        // Step 1: Clean up previous generated files
-        self.cleanup_previous_generated_files()?;
-        println!("✅ Cleaned up previous generated files");
-
-        // Step 2: Validate schemas
+        // Step 1: Validate schemas
         self.registry
             .validate()
             .map_err(|errors| format!("Schema validation failed:\n{}", errors.join("\n")))?;
         println!("✅ Schema validation passed");
 
-        // Step 3: Collect schemas from registry
+        // Step 2: Collect schemas from registry
         let schemas = self.collect_schemas()?;
         println!("✅ Collected {} entity schemas", schemas.len());
 
+        // Step 3: Clean up generated files of domains no longer in the registry.
+        // Files for current domains are left in place so the flush pass can
+        // skip rewriting the ones whose content is unchanged.
+        self.cleanup_previous_generated_files(&schemas)?;
+        println!("✅ Cleaned up stale generated files");
+
         // Step 4: Create domain directories
         self.create_domain_directories(&schemas)?;
         println!("✅ Created domain directories");
 
+        // Accumulate generated files and flush them in batched write passes
+        // instead of one open/write/close round-trip per generator call
+        let mut pending_writes: Vec<(String, String)> = Vec::new();
+
         // Step 5: Generate domain modules with entity.rs enabled (EARLY)
-        self.generate_domain_modules_with_entities(&schemas)?;
+        self.generate_domain_modules_with_entities(&schemas, &mut pending_writes)?;
         println!("✅ Generated domain modules with entities enabled (early)");
 
-        // Step 6: Generate Thrift definitions (for thrift compiler)
+        // Step 6: Single walk over the schemas generates every per-entity
+        // file (thrift definition, builder, Ent implementation) on one
+        // scoped thread per entity. The former RustGenerator step was a
+        // documented no-op and is not part of the walk.
         let thrift_gen = thrift_generator::ThriftGenerator::new(&self.registry);
-        for (entity_type, (fields, _edges)) in &schemas {
-            thrift_gen.generate_thrift_file(entity_type, fields)?;
+        let builder_gen = builder_generator::BuilderGenerator::new(&self.registry);
+        let ent_gen = ent_generator::EntGenerator::new(&self.registry);
+        let results: Vec<Result<[(String, String); 3], String>> = std::thread::scope(|scope| {
+            let handles: Vec<_> = schemas
+                .iter()
+                .map(|(entity_type, (fields, edges))| {
+                    let thrift_gen = &thrift_gen;
+                    let builder_gen = &builder_gen;
+                    let ent_gen = &ent_gen;
+                    scope.spawn(move || {
+                        Ok([
+                            thrift_gen.generate_thrift_file(entity_type, fields)?,
+                            builder_gen.generate_builder(entity_type, fields)?,
+                            ent_gen.generate_ent_impl(entity_type, fields, edges)?,
+                        ])
+                    })
+                })
+                .collect();
+            handles.into_iter().map(|h| h.join().unwrap()).collect()
+        });
+
+        // Split into the files the thrift compiler needs on disk first and
+        // the Rust sources that can wait for the final flush
+        let mut post_compile_writes: Vec<(String, String)> = Vec::new();
+        for result in results {
+            let [thrift_file, builder_file, ent_impl_file] = result?;
+            pending_writes.push(thrift_file);
+            post_compile_writes.push(builder_file);
+            post_compile_writes.push(ent_impl_file);
         }
         println!("✅ Generated Thrift definitions");
+        println!("✅ Generated builders with save() function");
+        println!("✅ Generated Ent implementations");
 
-        // Step 5: Compile Thrift files to generate Rust entity structs
-        self.compile_thrift_files(&schemas)?;
-        println!("✅ Compiled Thrift files to Rust entities");
-
-        // Step 6: Generate Rust-specific extensions (like new_default) for thrift-generated entities
-        let rust_gen = rust_generator::RustGenerator::new(&self.registry);
-        for (entity_type, (fields, _edges)) in &schemas {
-            rust_gen.generate_entity_struct(entity_type, fields)?;
+        // Record every generated path (sorted, for stable content) so the
+        // next run's cleanup can consult the manifest instead of scanning
+        let mut manifest_paths: Vec<String> = pending_writes
+            .iter()
+            .chain(post_compile_writes.iter())
+            .map(|(path, _)| path.clone())
+            .collect();
+        for entity_type in schemas.keys() {
+            manifest_paths.push(format!(
+                "src/domains/{}/entity.rs",
+                utils::entity_domain_name(entity_type)
+            ));
         }
-        println!("✅ Generated Rust entity extensions");
+        manifest_paths.sort();
+        let mut manifest_write = vec![(
+            GENERATED_MANIFEST.to_string(),
+            manifest_paths.join("\n") + "\n",
+        )];
 
-        // Step 6: Generate builders with save() function
-        let builder_gen = builder_generator::BuilderGenerator::new(&self.registry);
-        for (entity_type, (fields, _edges)) in &schemas {
-            builder_gen.generate_builder(entity_type, fields)?;
-        }
-        println!("✅ Generated builders with save() function");
+        // Flush now: the thrift compiler reads the .thrift files from disk
+        self.flush_writes(&mut pending_writes)?;
 
-        // Step 9: Generate Ent trait implementations
-        let ent_gen = ent_generator::EntGenerator::new(&self.registry);
-        for (entity_type, (fields, edges)) in &schemas {
-            ent_gen.generate_ent_impl(entity_type, fields, edges)?;
-        }
-        println!("✅ Generated Ent implementations");
+        // Step 7: Compile Thrift files to generate Rust entity structs
+        self.compile_thrift_files(&schemas)?;
+        println!("✅ Compiled Thrift files to Rust entities");
+
+        // Final flush for builders, Ent implementations, and the manifest
+        self.flush_writes(&mut post_compile_writes)?;
+        self.flush_writes(&mut manifest_write)?;
 
         println!("🎉 Modular codegen pipeline completed successfully!");
 
         Ok(())
     }
 
+    /// Write all accumulated (path, content) pairs to disk in one pass.
+    /// Files whose on-disk contents already match are skipped, so unchanged
+    /// generated files keep their mtime and don't trigger cargo rebuilds.
+    fn flush_writes(&self, pending: &mut Vec<(String, String)>) -> Result<(), String> {
+        for (path, content) in pending.drain(..) {
+            if let Ok(existing) = std::fs::read(&path) {
+                if existing == content.as_bytes() {
+                    continue;
+                }
+            }
+            std::fs::write(&path, content)
+                .map_err(|e| format!("Failed to write {}: {}", path, e))?;
+        }
+        Ok(())
+    }
+
     /// Collect schemas from registry
     fn collect_schemas(
         &self,
@@ -100,8 +163,11 @@ impl CodeGenerator {
         Ok(schemas)
     }
 
-    /// Clean up all previously generated files to ensure clean builds
-    fn cleanup_previous_generated_files(&self) -> Result<(), String> {
+    /// Clean up generated files of domains that are no longer in the registry
+    fn cleanup_previous_generated_files(
+        &self,
+        schemas: &HashMap<EntityType, (Vec<FieldDefinition>, Vec<EdgeDefinition>)>,
+    ) -> Result<(), String> {
         use std::fs;
         use std::path::Path;
 
@@ -110,7 +176,40 @@ impl CodeGenerator {
             return Ok(()); // Nothing to clean up
         }
 
-        // Read all domain directories
+        let current_domains: std::collections::HashSet<String> = schemas
+            .keys()
+            .map(|entity_type| utils::entity_domain_name(entity_type))
+            .collect();
+
+        // Fast path: the manifest from the previous run lists exactly what
+        // was generated, so stale files can be removed without walking the
+        // whole domain tree
+        if let Ok(manifest) = fs::read_to_string(GENERATED_MANIFEST) {
+            for line in manifest.lines() {
+                let file_path = line.trim();
+                // A domain file looks like src/domains/<domain>/<file>;
+                // top-level entries such as src/domains/mod.rs are kept
+                let stale = file_path
+                    .strip_prefix("src/domains/")
+                    .and_then(|rest| rest.split_once('/'))
+                    .map(|(domain, _)| !current_domains.contains(domain))
+                    .unwrap_or(false);
+
+                if stale {
+                    match fs::remove_file(file_path) {
+                        Ok(()) => {}
+                        Err(e) if e.kind() == std::io::ErrorKind::NotFound => {}
+                        Err(e) => {
+                            return Err(format!("Failed to remove {}: {}", file_path, e));
+                        }
+                    }
+                }
+            }
+            return Ok(());
+        }
+
+        // Fallback: no manifest yet (first run, or it was deleted) — walk
+        // the domain directories as before
         let entries = fs::read_dir(domains_dir)
             .map_err(|e| format!("Failed to read domains directory: {}", e))?;
 
@@ -119,16 +218,31 @@ impl CodeGenerator {
             let path = entry.path();
 
             if path.is_dir() {
-                // Remove generated files in each domain directory
+                // Skip domains that will be regenerated this run
+                if let Some(name) = path.file_name().and_then(|n| n.to_str()) {
+                    if current_domains.contains(name) {
+                        continue;
+                    }
+                }
+
+                // Remove generated files in each stale domain directory
                 let files_to_remove =
                     vec!["entity.thrift", "entity.rs", "builder.rs", "ent_impl.rs"];
 
                 for file_name in files_to_remove {
                     let file_path = path.join(file_name);
-                    if file_path.exists() {
-                        fs::remove_file(&file_path).map_err(|e| {
-                            format!("Failed to remove {}: {}", file_path.display(), e)
-                        })?;
+                    // Single remove call instead of an exists() stat first;
+                    // a missing file is not an error
+                    match fs::remove_file(&file_path) {
+                        Ok(()) => {}
+                        Err(e) if e.kind() == std::io::ErrorKind::NotFound => {}
+                        Err(e) => {
+                            return Err(format!(
+                                "Failed to remove {}: {}",
+                                file_path.display(),
+                                e
+                            ));
+                        }
                     }
                 }
             }
@@ -146,6 +260,12 @@ impl CodeGenerator {
             let domain_name = utils::entity_domain_name(entity_type);
             let domain_path = format!("src/domains/{}", domain_name);
 
+            // Skip the create call (and its recursive parent walk) when the
+            // directory already exists from a previous run
+            if std::path::Path::new(&domain_path).is_dir() {
+                continue;
+            }
+
             std::fs::create_dir_all(&domain_path)
                 .map_err(|e| format!("Failed to create domain directory {}: {}", domain_path, e))?;
         }
@@ -202,21 +322,41 @@ impl CodeGenerator {
             return Err("Thrift compiler not found. Please install Apache Thrift.".to_string());
         }
 
-        // Compile each thrift file
+        // Compile each thrift file; build each domain path once and derive
+        // the file paths from it instead of re-formatting them per use
         for entity_type in schemas.keys() {
             let domain_name = utils::entity_domain_name(entity_type);
-            let thrift_file = format!("src/domains/{}/entity.thrift", domain_name);
+            let domain_dir_path = format!("src/domains/{}", domain_name);
+            let thrift_file = format!("{}/entity.thrift", domain_dir_path);
 
             if !std::path::Path::new(&thrift_file).exists() {
                 return Err(format!("Thrift file not found: {}", thrift_file));
             }
 
+            // Skip the compiler spawn when the generated entity.rs is already
+            // newer than its .thrift input (unchanged inputs keep their mtime
+            // thanks to the no-op write skip in flush_writes)
+            let entity_rs = format!("{}/entity.rs", domain_dir_path);
+            if let (Ok(thrift_meta), Ok(entity_meta)) = (
+                std::fs::metadata(&thrift_file),
+                std::fs::metadata(&entity_rs),
+            ) {
+                if let (Ok(thrift_mtime), Ok(entity_mtime)) =
+                    (thrift_meta.modified(), entity_meta.modified())
+                {
+                    if entity_mtime >= thrift_mtime {
+                        println!("  ✓ {} up to date, skipping", entity_rs);
+                        continue;
+                    }
+                }
+            }
+
             // Run thrift compiler to generate Rust code
             let output = std::process::Command::new("thrift")
                 .arg("--gen")
                 .arg("rs")
                 .arg("-out")
-                .arg(format!("src/domains/{}", domain_name))
+                .arg(&domain_dir_path)
                 .arg(&thrift_file)
                 .output()
                 .map_err(|e| format!("Failed to run thrift compiler on {}: {}", thrift_file, e))?;
@@ -230,10 +370,9 @@ impl CodeGenerator {
             }
 
             // Move the generated file to entity.rs
-            let generated_file = format!("src/domains/{}/entity.rs", domain_name);
+            let generated_file = format!("{}/entity.rs", domain_dir_path);
             if !std::path::Path::new(&generated_file).exists() {
                 // Thrift might generate with a different name, try to find it
-                let domain_dir_path = format!("src/domains/{}", domain_name);
                 let domain_dir = std::path::Path::new(&domain_dir_path);
                 if let Ok(entries) = std::fs::read_dir(domain_dir) {
                     for entry in entries {
@@ -269,32 +408,31 @@ impl CodeGenerator {
     fn generate_domain_modules_with_entities(
         &self,
         schemas: &HashMap<EntityType, (Vec<FieldDefinition>, Vec<EdgeDefinition>)>,
+        pending_writes: &mut Vec<(String, String)>,
     ) -> Result<(), String> {
-        // Generate main domains mod.rs
-        let mut domains_mod = String::from("// Generated domain modules\n// DO NOT EDIT\n\n");
-
-        let mut domain_names = std::collections::HashSet::new();
+        // Resolve each domain name once; the sorted map keeps the emitted
+        // module list deterministic so unchanged files are skipped on flush
+        let mut domains = std::collections::BTreeMap::new();
         for entity_type in schemas.keys() {
-            domain_names.insert(utils::entity_domain_name(entity_type));
+            domains.insert(utils::entity_domain_name(entity_type), entity_type);
         }
 
-        for domain_name in domain_names {
+        // Generate main domains mod.rs
+        let mut domains_mod = String::from("// Generated domain modules\n// DO NOT EDIT\n\n");
+        for domain_name in domains.keys() {
             domains_mod.push_str(&format!("pub mod {};\n", domain_name));
         }
 
-        std::fs::write("src/domains/mod.rs", domains_mod)
-            .map_err(|e| format!("Failed to write domains/mod.rs: {}", e))?;
+        pending_writes.push(("src/domains/mod.rs".to_string(), domains_mod));
 
         // Generate individual domain mod.rs files with entity.rs enabled
-        for entity_type in schemas.keys() {
-            let domain_name = utils::entity_domain_name(entity_type);
+        for (domain_name, entity_type) in &domains {
             let mod_content = format!(
                 "// Generated domain module for {}\n// DO NOT EDIT\n\npub mod entity;\npub mod builder;\npub mod ent_impl;\n\npub use entity::*;\npub use builder::*;\npub use ent_impl::*;\n",
                 entity_type
             );
             let mod_path = format!("src/domains/{}/mod.rs", domain_name);
-            std::fs::write(mod_path, mod_content)
-                .map_err(|e| format!("Failed to write domain mod.rs: {}", e))?;
+            pending_writes.push((mod_path, mod_content));
         }
         Ok(())
     }
@@ -15,17 +15,19 @@ impl<'a> ThriftGenerator<'a> {
         }
     }
 
-    /// Generate pure Thrift structure file
+    /// Generate pure Thrift structure file content, returned as a
+    /// (path, content) pair for the caller to batch-write
     pub fn generate_thrift_file(
         &self,
         entity_type: &EntityType,
         fields: &[FieldDefinition],
-    ) -> Result<(), String> {
+    ) -> Result<(String, String), String> {
         let domain_name = utils::entity_domain_name(entity_type);
-        let _struct_name = utils::entity_struct_name(entity_type);
+        let struct_name = utils::entity_struct_name(entity_type);
         let thrift_path = format!("src/domains/{}/entity.thrift", domain_name);
 
-        let mut thrift_content = String::new();
+        // Generated thrift files run 1-2KB; size the buffer once up front
+        let mut thrift_content = String::with_capacity(2 * 1024);
 
         // Thrift header
         thrift_content.push_str(&format!(
@@ -34,73 +36,72 @@ impl<'a> ThriftGenerator<'a> {
         ));
         thrift_content.push_str(&utils::generate_file_header(
             "Thrift definition",
-            entity_type,
+            &struct_name,
         ));
         thrift_content.push_str("include \"../../core/tao.thrift\"\n\n");
 
         // Generate field validation typedefs
-        thrift_content.push_str(&self.generate_field_typedefs(entity_type, fields)?);
+        self.generate_field_typedefs(&mut thrift_content, &struct_name, fields)?;
 
         // Generate validation exception
-        thrift_content.push_str(&self.generate_validation_exception()?);
+        self.generate_validation_exception(&mut thrift_content)?;
 
         // Generate pure struct (no functions allowed in Thrift)
-        thrift_content.push_str(&self.generate_thrift_struct(entity_type, fields)?);
-
-        // Write to file
-        std::fs::write(&thrift_path, thrift_content)
-            .map_err(|e| format!("Failed to write Thrift file {}: {}", thrift_path, e))?;
+        self.generate_thrift_struct(&mut thrift_content, &struct_name, fields)?;
 
-        Ok(())
+        Ok((thrift_path, thrift_content))
     }
 
-    /// Generate field validation typedefs
+    /// Generate field validation typedefs directly into the output buffer
     fn generate_field_typedefs(
         &self,
-        entity_type: &EntityType,
+        buf: &mut String,
+        struct_name: &str,
         fields: &[FieldDefinition],
-    ) -> Result<String, String> {
-        let mut typedefs = String::new();
+    ) -> Result<(), String> {
+        // Uppercase the struct name once rather than per string field
+        let struct_upper = struct_name.to_uppercase();
 
-        typedefs.push_str("// Field validation typedefs\n");
+        buf.push_str("// Field validation typedefs\n");
         for field in fields {
             if field.field_type == FieldType::String {
-                let typedef_name = format!(
-                    "{}_{}",
-                    utils::entity_struct_name(entity_type).to_uppercase(),
+                buf.push_str(&format!(
+                    "typedef string {}_{}\n",
+                    struct_upper,
                     field.name.to_uppercase()
-                );
-                typedefs.push_str(&format!("typedef string {}\n", typedef_name));
+                ));
             }
         }
-        typedefs.push('\n');
+        buf.push('\n');
 
-        Ok(typedefs)
+        Ok(())
     }
 
-    /// Generate validation exception
-    fn generate_validation_exception(&self) -> Result<String, String> {
-        Ok(r#"// Validation exception
+    /// Generate validation exception directly into the output buffer
+    fn generate_validation_exception(&self, buf: &mut String) -> Result<(), String> {
+        buf.push_str(
+            r#"// Validation exception
 exception ValidationException {
     1: required string message,
     2: optional string field,
 }
 
-"#
-        .to_string())
+"#,
+        );
+        Ok(())
     }
 
-    /// Generate the main Thrift struct
+    /// Generate the main Thrift struct directly into the output buffer
     fn generate_thrift_struct(
         &self,
-        entity_type: &EntityType,
+        buf: &mut String,
+        struct_name: &str,
         fields: &[FieldDefinition],
-    ) -> Result<String, String> {
-        let struct_name = utils::entity_struct_name(entity_type);
-        let mut struct_def = format!("struct {} {{\n", struct_name);
+    ) -> Result<(), String> {
+        buf.push_str(&format!("struct {} {{\n", struct_name));
 
         // Always add ID field first
-        struct_def.push_str("    1: required i64 id,\n");
+        buf.push_str("    1: required i64 id,\n");
 
         // Add other fields starting from field number 2
         for (index, field) in fields.iter().enumerate() {
@@ -113,19 +114,18 @@ exception ValidationException {
             let required_str = utils::is_required_field(field.optional);
             let thrift_type = utils::field_type_to_thrift(&field.field_type);
 
-            struct_def.push_str(&format!(
+            buf.push_str(&format!(
                 "    {}: {} {} {},\n",
                 field_num, required_str, thrift_type, field.name
             ));
         }
 
-        struct_def.push_str("}\n\n");
+        buf.push_str("}\n\n");
 
         // Add comment about pure structure
-        struct_def.push_str("// Pure structure definition - no functions allowed in Thrift\n");
-        struct_def
-            .push_str("// Functions will be generated by codegen and implemented in Rust\n\n");
+        buf.push_str("// Pure structure definition - no functions allowed in Thrift\n");
+        buf.push_str("// Functions will be generated by codegen and implemented in Rust\n\n");
 
-        Ok(struct_def)
+        Ok(())
     }
 }
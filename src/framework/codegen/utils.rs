@@ -1,30 +1,33 @@
 // Utility functions for code generation
 use crate::framework::schema::ent_schema::{EntityType, FieldType};
 
-/// Convert entity type to domain name (e.g., EntUser -> "user")
+/// Convert entity type to domain name (e.g., EntUser -> "user").
+/// Every EntityType::as_str() value carries the "ent_" prefix, so this is
+/// a plain slice with no runtime branch.
 pub fn entity_domain_name(entity_type: &EntityType) -> String {
-    let type_str = entity_type.as_str();
-    if type_str.starts_with("ent_") {
-        type_str[4..].to_string()
-    } else {
-        type_str.to_string()
-    }
+    entity_type.as_str()[4..].to_string()
 }
 
 /// Convert entity type to struct name (e.g., EntUser -> "EntUser")
 pub fn entity_struct_name(entity_type: &EntityType) -> String {
-    // Convert snake_case to PascalCase
+    // Convert snake_case to PascalCase in a single pass, without the
+    // intermediate per-word String allocations of a split/map/collect chain
     let type_str = entity_type.as_str();
-    type_str
-        .split('_')
-        .map(|word| {
-            let mut chars = word.chars();
-            match chars.next() {
-                None => String::new(),
-                Some(first) => first.to_uppercase().collect::<String>() + chars.as_str(),
-            }
-        })
-        .collect()
+    let mut result = String::with_capacity(type_str.len());
+    let mut capitalize_next = true;
+
+    for c in type_str.chars() {
+        if c == '_' {
+            capitalize_next = true;
+        } else if capitalize_next {
+            result.extend(c.to_uppercase());
+            capitalize_next = false;
+        } else {
+            result.push(c);
+        }
+    }
+
+    result
 }
 
 /// Convert entity type to builder name (e.g., "ent_user" -> "EntUserBuilder")
@@ -34,39 +37,45 @@ pub fn entity_builder_name(entity_type: &EntityType) -> String {
 
 /// Convert field type to Rust type
 pub fn field_type_to_rust(field_type: &FieldType, optional: bool) -> String {
-    let base_type = match field_type {
-        FieldType::String => "String".to_string(),
-        FieldType::Int => "i32".to_string(),
-        FieldType::Int64 => "i64".to_string(),
-        FieldType::Bool => "bool".to_string(),
-        FieldType::Float => "f64".to_string(),
-        FieldType::Bytes => "Vec<u8>".to_string(),
-        FieldType::Time => "i64".to_string(), // Unix timestamp
-        FieldType::UUID => "String".to_string(), // String representation
-        FieldType::JSON => "String".to_string(), // JSON as string
-        FieldType::Enum(_variants) => "String".to_string(), // Enum as string for simplicity
-    };
+    let base_type = base_rust_type(field_type);
 
     if optional {
         format!("Option<{}>", base_type)
     } else {
-        base_type
+        base_type.to_string()
+    }
+}
+
+/// Static Rust type name for a field type — the table lives in the
+/// binary's rodata instead of being reallocated on every call
+fn base_rust_type(field_type: &FieldType) -> &'static str {
+    match field_type {
+        FieldType::String => "String",
+        FieldType::Int => "i32",
+        FieldType::Int64 => "i64",
+        FieldType::Bool => "bool",
+        FieldType::Float => "f64",
+        FieldType::Bytes => "Vec<u8>",
+        FieldType::Time => "i64",            // Unix timestamp
+        FieldType::UUID => "String",         // String representation
+        FieldType::JSON => "String",         // JSON as string
+        FieldType::Enum(_variants) => "String", // Enum as string for simplicity
     }
 }
 
 /// Convert field type to Thrift type
-pub fn field_type_to_thrift(field_type: &FieldType) -> String {
+pub fn field_type_to_thrift(field_type: &FieldType) -> &'static str {
     match field_type {
-        FieldType::String => "string".to_string(),
-        FieldType::Int => "i32".to_string(),
-        FieldType::Int64 => "i64".to_string(),
-        FieldType::Bool => "bool".to_string(),
-        FieldType::Float => "double".to_string(),
-        FieldType::Bytes => "binary".to_string(),
-        FieldType::Time => "i64".to_string(), // Unix timestamp as i64
-        FieldType::UUID => "string".to_string(), // UUID as string
-        FieldType::JSON => "string".to_string(), // JSON as string
-        FieldType::Enum(_variants) => "string".to_string(), // Enum as string
+        FieldType::String => "string",
+        FieldType::Int => "i32",
+        FieldType::Int64 => "i64",
+        FieldType::Bool => "bool",
+        FieldType::Float => "double",
+        FieldType::Bytes => "binary",
+        FieldType::Time => "i64",            // Unix timestamp as i64
+        FieldType::UUID => "string",         // UUID as string
+        FieldType::JSON => "string",         // JSON as string
+        FieldType::Enum(_variants) => "string", // Enum as string
     }
 }
 
@@ -86,7 +95,7 @@ pub fn is_required_field(optional: bool) -> &'static str {
 
 /// Convert snake_case to camelCase
 pub fn snake_to_camel(s: &str) -> String {
-    let mut result = String::new();
+    let mut result = String::with_capacity(s.len());
     let mut chars = s.chars();
 
     if let Some(first) = chars.next() {
@@ -108,10 +117,11 @@ pub fn snake_to_camel(s: &str) -> String {
     result
 }
 
-/// Generate file header comment
-pub fn generate_file_header(file_type: &str, entity_type: &EntityType) -> String {
+/// Generate file header comment; takes the already-computed struct name
+/// so callers don't trigger another case conversion
+pub fn generate_file_header(file_type: &str, struct_name: &str) -> String {
     format!(
         "// Generated {} for {}\n// Generated by TAO Ent Framework - DO NOT EDIT\n// Regenerate with: cargo run --bin entc generate\n\n",
-        file_type, entity_struct_name(entity_type)
+        file_type, struct_name
     )
 }